@@ -1,31 +1,23 @@
 import os
 from datetime import datetime, timezone
+from functools import cache
 from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
-from jinja2 import Template
 from opentelemetry import trace
 from sentry_sdk import monitor
 from structlog import get_logger
 
 from meri.settings import settings, init_settings
 
-from .lautta import (
-    RahtiCleaner,
-    convert_for_rahti,
-    fetch_full_articles,
-    fetch_latest,
-    generate_titles,
-    has_handled_url,
-    prune_rahti,
-)
-from .rahti import COMMIT_MESSAGE, RahtiData, create_rahti
-from .scraper import get_extractor, try_setup_requests_cache
 from .utils import setup_logging, setup_sentry, setup_tracing
 
-try:
-    from rich.pretty import pprint
-except ImportError:
-    from pprint import pprint
+# The pipeline modules pull in haystack, LLM clients and extractors; import them only in the commands that need them,
+# so that `--help` and light commands start fast.
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+    from .lautta import RahtiCleaner
 
 try:
     import rich_click as click
@@ -60,16 +52,87 @@ def cli(cache: bool, debug: bool):
         if not _requests_cache_available:
             raise RuntimeError("requests_cache is not available, cannot enable caching.")
 
+        from .scraper import try_setup_requests_cache
         try_setup_requests_cache()
 
 
 
+@cache
+def commit_template() -> "Template":
+    """
+    Compiled Jinja template for Rahti commit messages.
+    """
+    from jinja2 import Template
+
+    from .rahti import COMMIT_MESSAGE
+    return Template(COMMIT_MESSAGE)
+
+
+def update_articles(rahti: "RahtiCleaner", latest_articles: list) -> tuple[list, list]:
+    """
+    Fetch full articles, generate titles for them and upsert the results into Rahti.
+
+    Returns the generated titles, and the entries refreshed with their previous title as their text is unchanged.
+    """
+    from .lautta import (
+        convert_for_rahti,
+        fetch_full_articles,
+        generate_titles,
+        has_handled_url,
+        has_unchanged_text,
+        refresh_rahti_entry,
+    )
+
+    # Fetch full articles for those that need updating
+    logger.info("After checking for updates, %d articles need updating", len(latest_articles))
+    full_articles = fetch_full_articles(latest_articles)
+
+    nr = len(full_articles)
+
+    # Prune out articles that are not needed to be processed further
+    full_articles = [a for a in full_articles if has_handled_url(a.article)]
+
+    logger.info("After pruning unhandled articles, %d (of %d) articles remain", len(full_articles), nr, extra={"removed": nr - len(full_articles)})
+
+    ## Generate titles for articles
+    # Collect old titles. Articles with unchanged text keep theirs, skipping the LLM.
+    to_generate = []
+    old_titles = []
+    refreshed = []
+    for a in full_articles:
+        old_entry = rahti.find_by_article(a.article)
+        if old_entry and has_unchanged_text(a.article, old_entry):
+            logger.info("Article text unchanged, reusing previous title: %r", old_entry.title, extra={"url": str(a.article.get_url())})
+            entry = refresh_rahti_entry(a.source, a.article, old_entry)
+            rahti.upsert(entry)
+            refreshed.append(entry)
+            continue
+
+        to_generate.append(a)
+        old_titles.append(old_entry)
+
+    titles = generate_titles(to_generate, old_titles=old_titles)
+
+    # Match articles to old Rahti entries
+    for result in titles:
+        if not result.source:
+            logger.warning("Article result has no source, skipping: %r", result.article.get_url())
+            continue
+
+        rahti_entry = convert_for_rahti(result.source, result.article, result.title)
+        rahti.upsert(rahti_entry)
+
+    return titles, refreshed
+
+
 @cli.command()
 @click.option("--sample", is_flag=True, help="Use limited data.")
 @click.option("--max-workers", type=int, default=1 if os.getenv("DEBUG") else None, help="Maximum number of workers to use for fetching articles.")
 @tracer.start_as_current_span("cli.run")
 @monitor(monitor_slug=MERI_RUN_MONITOR_SLUG)
 def run(sample: bool, max_workers: int):
+    from .lautta import RahtiCleaner, fetch_latest, prune_rahti
+    from .rahti import RahtiData, create_rahti
 
     if max_workers is not None:
         settings.MAX_WORKERS = max_workers
@@ -81,73 +144,53 @@ def run(sample: bool, max_workers: int):
 
     logger.debug("Fetched old Rahti data, contains %d entries", len(old_data.entries), extra={"sha": hash_of_stored_file})
 
+    enabled_sources = [s for s in settings.sources if s.enabled]
+
     # Fetch latest articles from sources
-    latest_articles = fetch_latest(settings.sources)
+    latest_articles = fetch_latest(enabled_sources)
 
     if sample:
-        sorted_articles = sorted(latest_articles, key=lambda a: a.article.created_at or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+        min_date = datetime.min.replace(tzinfo=timezone.utc)
+        sorted_articles = sorted(latest_articles, key=lambda a: a.article.created_at or min_date, reverse=True)
         latest_articles = sorted_articles[0:5]
         logger.info("Sample mode enabled, limiting to %d articles", len(latest_articles))
 
-    logger.info("Fetched %d latest articles from sources", len(latest_articles), extra={"sources": [s.name for s in settings.sources]})
+    logger.info("Fetched %d latest articles from sources", len(latest_articles), extra={"sources": [s.name for s in enabled_sources]})
 
     # Initial cleanup: filter out articles that do not need updating
     rahti = RahtiCleaner(old_data)
 
     latest_articles = [a for a in latest_articles if rahti.needs_updating(a.article)]
 
-    # Early stop if no articles need updating
-    if not latest_articles:
-        logger.info("No articles need updating, exiting")
-        return
-
-    # Fetch full articles for those that need updating
-    logger.info("After checking for updates, %d articles need updating", len(latest_articles))
-    full_articles = fetch_full_articles(latest_articles)
+    titles = []
+    refreshed_entries = []
+    if latest_articles:
+        titles, refreshed_entries = update_articles(rahti, latest_articles)
+    else:
+        logger.info("No articles need updating")
 
     # free and prevent accidental usage
     del latest_articles
 
-    nr = len(full_articles)
-
-    # Prune out articles that are not needed to be processed further
-    full_articles = [a for a in full_articles if has_handled_url(a.article)]
-
-    logger.info("After pruning unhandled articles, %d (of %d) articles remain", len(full_articles), nr, extra={"removed": nr - len(full_articles)})
-
-    ## Generate titles for articles
-    # Collect old titles
-    old_titles = []
-    for a in full_articles:
-        old_titles.append(rahti.find_by_article(a.article))
-
-    titles = generate_titles(full_articles, old_titles=old_titles)
-
-    # Match articles to old Rahti entries
-    for result in titles:
-        if not result.source:
-            logger.warning("Article result has no source, skipping: %r", result.article.get_url())
-            continue
-
-        rahti_entry = convert_for_rahti(result.source, result.article, result.title)
-        rahti.upsert(rahti_entry)
-
     # Final pass - remove old entries that are no longer needed
-    cleaned_entries = prune_rahti(rahti.rahti.entries, settings.sources)
-
-    # collect removed entries for logging
-    removed_entries = [e for e in rahti.rahti.entries if e not in cleaned_entries]
+    cleaned_entries, removed_entries = prune_rahti(rahti.rahti.entries, enabled_sources)
     rahti.rahti.entries = cleaned_entries
 
     logger.info("After pruning Rahti entries, %d entries remain, %d removed", len(rahti.rahti.entries), len(removed_entries))
 
+    # Early stop if there is nothing to store
+    if not titles and not refreshed_entries and not removed_entries:
+        logger.info("Nothing to update, exiting")
+        return
+
     # Prepare commit message
     articles_for_commit = [t.article for t in titles if t.source]
     titles_for_commit = [t.title for t in titles if t.source]
 
-    commit_message = Template(COMMIT_MESSAGE).render(
+    commit_message = commit_template().render(
         articles=articles_for_commit,
         titles=titles_for_commit,
+        refreshed=refreshed_entries,
         removed=removed_entries,
     )
 
@@ -155,9 +198,9 @@ def run(sample: bool, max_workers: int):
     for t in titles:
         logger.info("Prepared article for Rahti: %r -> %r", t.article.get_url(), t.title.title)
 
-    # Validate before pushing
-    test_json = rahti.model_dump_json()
-    assert RahtiData.model_validate_json(test_json)
+    # Validate before pushing. Entries are mutated in place during the run, so revalidate from plain python data,
+    # skipping the JSON encode/decode round-trip.
+    RahtiData.model_validate(rahti.rahti.model_dump())
 
     rahti_repo.push(
         hash_of_stored_file,
@@ -180,11 +223,18 @@ def list_sources():
 @cli.command()
 @click.argument("url")
 def test(url):
+    from .scraper import get_extractor
+
     extractor = get_extractor(url)
     article = extractor.fetch_by_url(url)
     if article.text:
         print(article.text[0:200], "...", "\n", "...", article.text[-200:])
 
+    try:
+        from rich.pretty import pprint
+    except ImportError:
+        from pprint import pprint
+
     from .pipelines.title import TitlePredictor
     predictor = TitlePredictor()
     result = predictor.run(article)
@@ -1,20 +1,19 @@
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache, partial
 from re import Pattern
 from textwrap import dedent
 from typing import Annotated, List, Optional
 from typing_extensions import TypedDict
 from urllib.parse import ParseResult
 
-from opentelemetry import trace
-from pydantic import AnyHttpUrl, BaseModel, BeforeValidator, Field, computed_field
+from pydantic import AnyHttpUrl, BaseModel, BeforeValidator, Field, PrivateAttr, computed_field
 from structlog import get_logger
 
 from .utils import clean_url
 from .suola import hash_url
 
 logger = get_logger(__name__)
-tracer = trace.get_tracer(__name__)
 
 type UrlPattern = Pattern | AnyHttpUrl | ParseResult
 type PyObjectId = Annotated[str, BeforeValidator(str)]
@@ -282,11 +281,19 @@ class ArticleTitleResponse(BaseModel):
 class ArticleUrl(BaseModel):
     """
     Article URL.
+
+    URLs are immutable, so they can be shared between articles and their signatures computed only once.
     """
+    model_config = {
+        "frozen": True,
+    }
+
     href: AnyHttpUrl = Field()
-    labels: list[LinkLabel] = Field(default_factory=list)
+    labels: frozenset[LinkLabel] = Field(default_factory=frozenset)
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc))
+
+    _signature: Optional[str] = PrivateAttr(None)
 
     @computed_field
     @property
@@ -296,8 +303,10 @@ class ArticleUrl(BaseModel):
         """
         if not self.href:
             return ""
-        sign = hash_url(self.href)
-        return sign if sign else ""
+
+        if self._signature is None:
+            self._signature = hash_url(self.href) or ""
+        return self._signature
 
     def __str__(self):
         return str(self.href)
@@ -307,9 +316,16 @@ class ArticleUrl(BaseModel):
         if isinstance(other, str):
             return str(self.href) == other
         elif isinstance(other, ArticleUrl):
-            return self.href == other.href or self.signature == other.signature
+            if self.href == other.href:
+                return True
+            # URLs without a signature have nothing else in common
+            return bool(self.signature) and self.signature == other.signature
         return super().__eq__(other)
 
+    def __hash__(self):
+        # Consistent with __eq__: URLs with equal hrefs also have equal signatures
+        return hash(self.signature or str(self.href))
+
 
 class ArticleMeta(TypedDict, total=False):
     title: Optional[str]
@@ -394,5 +410,10 @@ def article_url(href: AnyHttpUrl | str, /, **kwargs) -> ArticleUrl:
     """
     Create an ArticleUrl object from a URL.
     """
-    url = clean_url(str(href))
-    return ArticleUrl(href=AnyHttpUrl(url), **kwargs)
+    return ArticleUrl(href=_clean_http_url(str(href)), **kwargs)
+
+
+@lru_cache(maxsize=4096)
+def _clean_http_url(href: str) -> AnyHttpUrl:
+    # The same URLs recur across sources, discovery and extraction. URL objects are immutable, so they can be shared.
+    return AnyHttpUrl(clean_url(href))
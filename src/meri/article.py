@@ -4,23 +4,20 @@ from typing import Optional
 from typing_extensions import Annotated
 
 import unicodedata
-from opentelemetry import trace
 
-from pydantic import AnyHttpUrl, BaseModel, BeforeValidator, Field, PrivateAttr, ValidationError
+from pydantic import AnyHttpUrl, BaseModel, BeforeValidator, Field, PrivateAttr
 from .abc import ArticleLabels, ArticleMeta, ArticleTypeLabels, ArticleUrl, LinkLabel
 
 from pydantic import computed_field
 
 logger = logging.getLogger(__name__)
-tracer = trace.get_tracer(__name__)
 
 def title_validator(v: str) -> str:
     """
-    Validate that the title is not empty or just whitespace.
+    Strip and normalize the title.
     """
     v = v.strip()
 
-
     # Unicode normalization, for suspicious characters
     normalized = unicodedata.normalize("NFKC", v)
     if v != normalized:
@@ -28,19 +25,6 @@ def title_validator(v: str) -> str:
 
     return normalized
 
-    # Check if contains non-printable characters
-    if any(not c.isprintable() for c in v):
-        raise ValidationError("Title contains non-printable characters")
-
-    # Check for newline characters
-    if "\n" in v or "\r" in v:
-        raise ValidationError("Title cannot contain newline characters")
-
-    if not v:
-        raise ValidationError("Title cannot be empty or just whitespace")
-
-    return v
-
 
 type ArticleTitle = Annotated[str, BeforeValidator(title_validator)]
 
@@ -95,15 +79,9 @@ class Article(BaseModel):
 
         If multiple URLs are present, prefer the canonical URL.
         """
-        if not self.urls:
-            return None
-
-        for url in self.urls:
-            # Prefer canonical URL if available
-            if LinkLabel.LINK_CANONICAL in url.labels:
-                return AnyHttpUrl(url.href)
-
-        return AnyHttpUrl(self.urls[0].href)
+        # URL objects are immutable, no need to copy (and revalidate) them
+        href = self.href
+        return href.href if href else None
 
     def update(self, other: "Article") -> "Article":
         """
@@ -124,23 +102,22 @@ class Article(BaseModel):
             self.updated_at = max(self.updated_at, other.updated_at)  # type: ignore
 
         # Merge missing metadata from stub to fetched object.
+        meta = self.meta
         for k, v in other.meta.items():
-            if k not in self.meta or not self.meta[k]:
-                self.meta[k] = v
+            if not meta.get(k):
+                meta[k] = v
 
-        # Append missing URLs from stub to fetched object.
-        existing_urls = set(map(lambda u: str(u.href), self.urls))
-        existing_signatures = set(map(lambda u: u.signature, self.urls))
+        # Append missing URLs from stub to fetched object. URLs Suola can't sign all have an empty signature, so
+        # tell those apart by their href.
+        existing_urls = {u.signature or str(u.href): i for i, u in enumerate(self.urls)}
         for url in other.urls:
-            if url.signature not in existing_signatures:
-                existing_signatures.add(url.signature)
+            key = url.signature or str(url.href)
+            if (i := existing_urls.get(key)) is None:
+                existing_urls[key] = len(self.urls)
                 self.urls.append(url)
-            else:
-                # Append missing labels
-                for label in url.labels:
-                    if label not in existing_urls:
-                        existing_urls.add(label)
-                continue
+            elif not url.labels <= (existing := self.urls[i]).labels:
+                # Merge missing labels. URLs are frozen, so replace the entry.
+                self.urls[i] = existing.model_copy(update={"labels": existing.labels | url.labels})
 
         # Copy over text if the other article has more text
         if len(self.text or "") < len(other.text or ""):
@@ -160,11 +137,12 @@ class Article(BaseModel):
         if not isinstance(other, Article):
             return super().__eq__(other)
 
-        if self.__hash__() == other.__hash__():
+        # Same article (fetched articles keep the id of their stub), no need to compare URLs
+        if self is other or self._id == other._id:
             return True
  
-        left = set((url.signature for url in self.urls if LinkLabel.LINK_CANONICAL in url.labels)) or set((url.signature for url in self.urls))
-        right = set((url.signature for url in other.urls if LinkLabel.LINK_CANONICAL in url.labels)) or set((url.signature for url in other.urls))
+        left = {url.signature for url in self.urls if LinkLabel.LINK_CANONICAL in url.labels} or {url.signature for url in self.urls}
+        right = {url.signature for url in other.urls if LinkLabel.LINK_CANONICAL in url.labels} or {url.signature for url in other.urls}
 
         return not left.isdisjoint(right)
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+import requests
 from pydantic import HttpUrl
 from typing import Optional
 
@@ -12,6 +13,7 @@ class SourceDiscoverer(ABC):
     """Base class for discovering article URLs from news sources"""
 
     source: Optional[NewsSource]
+    session: Optional[requests.Session] = None
 
     @abstractmethod
     def discover(self, source_url: HttpUrl, **kwargs) -> list[Article]:
@@ -22,3 +24,16 @@ class SourceDiscoverer(ABC):
         """Set the settings for this discoverer"""
         self.source = settings
         return self
+
+    def set_session(self, session: requests.Session):
+        """Set the HTTP session shared by requests to this source"""
+        self.session = session
+        return self
+
+    def http_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET the URL, reusing the connections of the shared session when one is set.
+        """
+        if self.session is None:
+            return requests.get(url, **kwargs)
+        return self.session.get(url, **kwargs)
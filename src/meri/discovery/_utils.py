@@ -14,37 +14,41 @@ def merge_article_lists(*article_lists: Iterable[Article]) -> list[Article]:
     """
     Merge multiple lists of articles into a single list, removing duplicates based on article URLs.
 
+    Duplicates are merged into the first seen article, so URLs and metadata only present in a later copy are kept.
+
     :param article_lists: Multiple iterables containing Article objects.
     :return: A single list of unique Article objects.
     """
-    seen_urls = set()
-    seen_ids = set()
+    # Lookup maps from URL key and article ID to the merged article
+    seen_urls: dict[str, Article] = {}
+    seen_ids: dict[str, Article] = {}
     merged_articles = []
 
     for article_list in article_lists:
         for article in article_list:
-            # Check if any of the article's URLs have been seen before
-            if any(url.href in seen_urls for url in article.urls):
-                continue  # Skip duplicate articles
+            url_keys = [url.signature or str(url.href) for url in article.urls]
 
-            # Add the article's URLs to the seen set
-            for url in article.urls:
-                seen_urls.add(url.href)
+            # Check if any of the article's URLs or its ID have been seen before
+            existing = next((seen_urls[key] for key in url_keys if key in seen_urls), None)
 
             article_id = article.meta.get("id", None)
+            if existing is None and article_id is not None and article_id in seen_ids:
+                logger.debug(
+                    "Merging article with duplicate ID",
+                    article_id=article_id,
+                    title=article.meta.get("title", "")
+                )
+                existing = seen_ids[article_id]
+
+            if existing is not None:
+                existing.update(article)
+            else:
+                existing = article
+                merged_articles.append(article)
+
+            for key in url_keys:
+                seen_urls.setdefault(key, existing)
             if article_id is not None:
-                # Check if the article's ID has been seen before
-                if article_id in seen_ids:
-                    logger.debug(
-                        "Skipping article with duplicate ID",
-                        article_id=article_id,
-                        title=article.meta.get("title", "")
-                    )
-                    continue  # Skip duplicate articles
-
-                # Add the article's ID to the seen set
-                seen_ids.add(article_id)
-
-            merged_articles.append(article)
+                seen_ids.setdefault(article_id, existing)
 
     return merged_articles
@@ -2,7 +2,6 @@
 
 from datetime import datetime, timedelta
 
-import requests
 from pydantic import HttpUrl
 from pytz import utc
 from structlog import get_logger
@@ -43,7 +42,7 @@ class IltalehtiFeedDiscoverer(SourceDiscoverer):
             List of Article objects with metadata
         """
 
-        response = requests.get(str(source_url), timeout=10)
+        response = self.http_get(str(source_url), timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -115,16 +114,16 @@ class IltalehtiFeedDiscoverer(SourceDiscoverer):
             List of ArticleUrl objects
         """
         article_href = BASE_URL.format(**article_data)
-        urls = [article_url(article_href)]
         
         # Add canonical URL if different from primary
         canon_url = article_data.get("metadata", {}).get("canonical_url")
         if canon_url and canon_url != article_href:
-            urls.append(article_url(canon_url, labels=[LinkLabel.LINK_CANONICAL]))
-        else:
-            urls[0].labels.append(LinkLabel.LINK_CANONICAL)
-        
-        return urls
+            return [
+                article_url(article_href),
+                article_url(canon_url, labels=[LinkLabel.LINK_CANONICAL]),
+            ]
+
+        return [article_url(article_href, labels=[LinkLabel.LINK_CANONICAL])]
     
     def _parse_updated_at(self, article_data: dict, created_at: datetime) -> datetime:
         """Parse updated_at timestamp or default to created_at.
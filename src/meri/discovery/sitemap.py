@@ -7,7 +7,6 @@ from datetime import datetime, timezone
 from pydantic import HttpUrl
 from structlog import get_logger
 from usp.tree import sitemap_from_str
-import requests
 
 from meri.abc import ArticleMeta, article_url
 from meri.article import Article
@@ -43,12 +42,10 @@ class SitemapDiscoverer(SourceDiscoverer):
             - 'max_depth': Maximum depth to traverse (default: 1, no traversal)
         :return: List of Article objects with metadata
         """
-        session = requests.Session()
-        session.headers.update({
+        res = self.http_get(str(source_url), timeout=kwargs.get('timeout', 10), headers={
             'User-Agent': settings.BOT_USER_AGENT,
             'Accept-Encoding': 'gzip, deflate',
         })
-        res = session.get(str(source_url), timeout=kwargs.get('timeout', 10))
         res.raise_for_status()
         sitemap_content = res.text
         tree = sitemap_from_str(sitemap_content)
@@ -7,6 +7,7 @@ New extactors can be added by creating a new class that inherits from the
 :class:`Outlet` class.
 """
 
+from functools import cache
 from importlib.resources import files
 import inspect
 from ._common import Outlet
@@ -48,13 +49,16 @@ def get_default_extractors() -> list[Outlet]:
     return extractors
 
 
-def get_extractors() -> list[Outlet]:
+@cache
+def get_extractors() -> tuple[Outlet, ...]:
     """
     Get all the extractors.
 
+    Outlets are stateless, so the modules are scanned and the extractors instantiated only once.
+
     ..todo:: Add support for custom extractors
     """
     default_extractors = get_default_extractors()
     # Sort the extractors by weight
-    return sorted(default_extractors, key=lambda x: x.weight, reverse=True)
+    return tuple(sorted(default_extractors, key=lambda x: x.weight, reverse=True))
     
\ No newline at end of file
@@ -1,8 +1,9 @@
 from abc import ABC
 from datetime import datetime, timedelta
+from functools import cache
 from re import Pattern
 import re
-from typing import Generic, Iterable, List, Optional, Protocol, TypeVar
+from typing import Generic, List, Optional, Protocol, TypeVar
 
 from pydantic import AnyHttpUrl, Field, HttpUrl
 from structlog import get_logger
@@ -42,6 +43,27 @@ class Outlet(ABC):
 
     weight: Optional[int] = 50
 
+    @classmethod
+    @cache
+    def url_patterns(cls) -> tuple[Pattern, ...]:
+        """
+        Get the outlet's :attr:`valid_url` rules compiled into regex patterns.
+
+        Plain string rules match URLs starting with the string. Compiled once per outlet class.
+        """
+        rules = cls.valid_url if isinstance(cls.valid_url, list) else [cls.valid_url]
+
+        patterns = []
+        for rule in rules:
+            match rule:
+                case Pattern():
+                    patterns.append(rule)
+                case str():
+                    patterns.append(re.compile(r"^" + re.escape(rule)))
+                case _:
+                    raise ValueError(f"Invalid outlet URL rule type: {type(rule)}")
+        return tuple(patterns)
+
     def frequency(self, dt: datetime | None) -> timedelta:
         """
         Get the frequency of the outlet.
@@ -138,63 +160,3 @@ class PolynomialDelayEstimator:
         predicted_delay = self.polynomial_delay_estimation(y)
 
         return timedelta(minutes=predicted_delay)
-
-
-def merge_article_lists(*article_lists: Iterable[Article]) -> list[Article]:
-    """
-    Merge multiple lists of articles into a single list, removing duplicates based on article URLs.
-
-    :param article_lists: Multiple iterables containing Article objects.
-    :return: A single list of unique Article objects.
-    """
-    seen_urls = set()
-    seen_ids = set()
-    merged_articles = []
-
-    for article_list in article_lists:
-        for article in article_list:
-            # Check if any of the article's URLs have been seen before
-            if any(url.href in seen_urls for url in article.urls):
-                continue  # Skip duplicate articles
-
-            # Add the article's URLs to the seen set
-            for url in article.urls:
-                seen_urls.add(url.href)
-
-            if article_id := article.meta.get("id", None) is None:
-                # Check if the article's ID has been seen before
-                if article_id in seen_ids:
-                    logger.debug("Skipping article with duplicate ID", extra={"article_id": article_id, "article": article})
-                    continue  # Skip duplicate articles
-
-                # Add the article's ID to the seen set
-                seen_ids.add(article_id)
-
-            merged_articles.append(article)
-
-    return merged_articles
-
-
-if __name__ == "__main__":
-    import logging
-
-    from ._extractors import RssParser
-    
-    logging.basicConfig(level=logging.DEBUG)
-
-    urls = [
-        "https://yle.fi/rss/uutiset/paauutiset",
-        "https://yle.fi/rss/uutiset/tuoreimmat",
-        "https://yle.fi/rss/uutiset/luetuimmat"
-    ]
-
-    rss_feeds = [
-        RssParser(url) for url in urls
-    ]
-
-    rss_articles = merge_article_lists(*rss_feeds)
-
-    print(rss_feeds[0].feed['feed'])
-    print(f"Parsed {len(rss_articles)} articles from {len(rss_feeds)} feeds")
-    # for article in rss_articles:
-    #     pprint(article)
@@ -116,7 +116,7 @@ def trafilatura_extractor(url: AnyHttpUrl | str) -> TrafilaturaArticle:
         article.created_at = datetime.now(timezone.utc)
 
     if document.url != url:
-        article.urls.append(article_url(url, type=LinkLabel.LINK_MOVED))
+        article.urls.append(article_url(url, labels=[LinkLabel.LINK_MOVED]))
 
     return article
 
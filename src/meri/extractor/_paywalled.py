@@ -20,6 +20,9 @@ from structlog import get_logger
 
 logger = get_logger(__name__)
 
+PAYWALL_PROPERTY = "isAccessibleForFree"
+""" Schema.org property marking content as paywalled. """
+
 
 def is_paywalled_content(html_string: str) -> bool:
     """
@@ -36,6 +39,10 @@ def is_paywalled_content(html_string: str) -> bool:
     :param html_string: The HTML content as a string.
     :return: True if paywalled indicators are found, False otherwise.
     """
+    # All supported formats use the `isAccessibleForFree` property. Skip building the DOM if it's not present at all.
+    if PAYWALL_PROPERTY not in html_string:
+        return False
+
     try:
         tree = html.fromstring(html_string)
     except Exception:
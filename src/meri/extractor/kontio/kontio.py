@@ -8,6 +8,7 @@ TODO: Convert the HTML into markdown for consistency with other extractors.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+import re
 from urllib.parse import urlparse
 import uuid
 from typing import Final
@@ -211,7 +212,7 @@ class KSMLExtractor(KontioExtractor):
     """Extractor for Keskisuomalainen (KSML) articles via Kontio API."""
 
     name = "KSML"
-    valid_url = r"https://www\.ksml\.fi/"
+    valid_url = re.compile(r"^https://www\.ksml\.fi/")
     weight = 60
     
     # KSML API publication identifier
@@ -2,6 +2,8 @@ import logging
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import hashlib
+import heapq
 import random
 import threading
 from typing import Iterable, List, NamedTuple, Optional, Tuple, cast
@@ -9,7 +11,7 @@ from typing import Iterable, List, NamedTuple, Optional, Tuple, cast
 import pytz
 import wrapt
 
-from .abc import ArticleTitleResponse
+from .abc import ArticleTitleResponse, ClickbaitScale, LinkLabel
 from .article import Article
 from .pipelines.title import TitlePredictor
 from .rahti import RahtiData, RahtiEntry, RahtiUrl
@@ -18,8 +20,12 @@ from .settings import settings
 from .settings.newssources import NewsSource
 from .utils import setup_logging
 
+# Maximum number of concurrent article fetches against a single host
 MAX_PARALLEL_FETCHES = 3
 
+# Fallback for missing dates when comparing timezone aware datetimes
+MIN_DATE = datetime.min.replace(tzinfo=pytz.UTC)
+
 logger = logging.getLogger(__name__)
 
 def fetch_source(source: NewsSource) -> List[Article]:
@@ -40,8 +46,6 @@ def fetch_source(source: NewsSource) -> List[Article]:
 
     # Remove old articles based on max_age_days
     if source.max_age_days is not None:
-        from datetime import datetime, timedelta
-
         now = datetime.now(pytz.UTC)
         cutoff_date = now - timedelta(days=source.max_age_days)
         original_count = len(articles)
@@ -105,10 +109,9 @@ def fetch_latest[T: NewsSource](sources: Iterable[T]) -> List[DiscoveredArticle[
     with ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
         futures = [executor.submit(fetch_source, source) for source in enabled_sources]
 
-        for future in futures:
+        for source, future in zip(enabled_sources, futures):
             try:
                 result = future.result()
-                source = enabled_sources[futures.index(future)]
                 ret.extend(DiscoveredArticle(source=source, article=article) for article in result)
             except Exception as e:
                 # Log the error and continue with other sources
@@ -133,7 +136,8 @@ def fetch_full_articles(discovered_stubs: list[DiscoveredArticle]) -> list[Disco
             raise ValueError(f"Article stub has no URL: {stub}")
 
         extractor = get_extractor(url)
-        extracted_article = extractor.fetch_by_url(url)
+        with host_limits[url.host]:
+            extracted_article = extractor.fetch_by_url(url)
         if not extracted_article:
             raise ValueError(f"Failed to fetch article from URL: {url}")
 
@@ -147,15 +151,38 @@ def fetch_full_articles(discovered_stubs: list[DiscoveredArticle]) -> list[Disco
         return DiscoveredArticle(source=source, article=extracted_article)
 
     discovered_stubs = list(discovered_stubs)
+
+    # Several sources may surface the same article, only fetch it once
+    unique_stubs: dict[str, DiscoveredArticle] = {}
+    nr_without_url = 0
+    for stub in discovered_stubs:
+        if not (url := stub.article.get_url()):
+            logger.warning("Skipping article stub without URL: %r", stub.article.title, extra={"source": stub.source.name})
+            nr_without_url += 1
+            continue
+        unique_stubs.setdefault(str(url), stub)
+
+    if nr_duplicates := len(discovered_stubs) - nr_without_url - len(unique_stubs):
+        logger.info("Skipping %d duplicate article stubs", nr_duplicates)
+
+    discovered_stubs = list(unique_stubs.values())
     # Shuffle article stubs to avoid overloading a single source
     random.shuffle(discovered_stubs)
 
+    # Cap concurrent requests per host, so that a large worker pool doesn't hammer a single outlet
+    host_limits: dict[str | None, threading.Semaphore] = {}
+    for stub in discovered_stubs:
+        if (url := stub.article.get_url()) and url.host not in host_limits:
+            host_limits[url.host] = threading.Semaphore(MAX_PARALLEL_FETCHES)
+
     articles = []
 
     with ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
         logger.info("Fetching %d articles using %d threads", len(discovered_stubs), executor._max_workers)
-        for stub in discovered_stubs:
-            future = executor.submit(fetch_article, stub.source, stub.article)
+        # Submit all fetches before waiting on any of them, so downloads overlap
+        futures = [executor.submit(fetch_article, stub.source, stub.article) for stub in discovered_stubs]
+
+        for stub, future in zip(discovered_stubs, futures):
             try:
                 article = future.result()
                 if not article:
@@ -169,7 +196,7 @@ def fetch_full_articles(discovered_stubs: list[DiscoveredArticle]) -> list[Disco
     return articles
 
 
-def prune_rahti(rahti: List[RahtiEntry], sources: list[NewsSource]) -> List[RahtiEntry]:
+def prune_rahti(rahti: List[RahtiEntry], sources: list[NewsSource]) -> Tuple[List[RahtiEntry], List[RahtiEntry]]:
     """
     Filter RahtiEntry objects based on source-specific filtering settings.
     
@@ -178,61 +205,57 @@ def prune_rahti(rahti: List[RahtiEntry], sources: list[NewsSource]) -> List[Raht
     
     :param rahti: List of RahtiEntry objects to filter
     :param sources: List of NewsSource configurations with filtering rules
-    :return: Filtered list of RahtiEntry objects in original order
+    :return: Tuple of kept and removed RahtiEntry objects, both in original order
     """
     # Build a lookup map from source name to source settings
     source_map = {source.name: source for source in sources if source.name and source.enabled}
     
     if not source_map:
         logger.info("No enabled sources with names found, returning empty rahti")
-        return []
+        return [], list(rahti)
     
     now = datetime.now(pytz.UTC)
 
-    # First pass: filter by max_age_days and enabled status
-    filtered_entries = []
-    for entry in rahti:
+    # Pre-compute cutoff dates per source
+    cutoff_dates = {
+        name: now - timedelta(days=source.max_age_days)
+        for name, source in source_map.items()
+        if source.max_age_days is not None
+    }
+
+    # Single pass: filter by max_age_days and enabled status, grouping the remaining entries by source outlet
+    entries_by_source: dict[str, List[tuple[int, RahtiEntry]]] = defaultdict(list)
+    for idx, entry in enumerate(rahti):
         # Skip entries without outlet information or from disabled/unknown sources
         if not entry.outlet or entry.outlet not in source_map:
             logger.debug("Skipping entry with unknown or disabled outlet: %r", entry.outlet)
             continue
 
-        source = source_map[entry.outlet]
-        
         # Apply max_age_days filter if set
-        if source.max_age_days is not None:
-            # TODO: Maybe pre-compute cutoff dates per source for efficiency
-            cutoff_date = now - timedelta(days=source.max_age_days)
-            if entry.updated < cutoff_date:
-                continue
+        cutoff_date = cutoff_dates.get(entry.outlet)
+        if cutoff_date is not None and entry.updated < cutoff_date:
+            continue
+
+        entries_by_source[entry.outlet].append((idx, entry))
 
-        filtered_entries.append(entry)
-    
-    # Second pass: apply max_num_articles per source, keeping newest entries
-    # Group entries by source outlet
-    entries_by_source: dict[str, List[tuple[int, RahtiEntry]]] = defaultdict(list)
-    for idx, entry in enumerate(filtered_entries):
-        entries_by_source[entry.outlet].append((idx, entry))  # type: ignore
-    
     # For each source, keep only the newest max_num_articles entries
     indices_to_keep = set()
     for outlet, indexed_entries in entries_by_source.items():
-        source = source_map.get(outlet)
-        if source is None:
-            continue
-        
+        source = source_map[outlet]
+
         if source.max_num_articles is not None:
-            # Sort by updated timestamp (newest first), keep indices for ordering
-            sorted_entries = sorted(indexed_entries, key=lambda x: x[1].updated, reverse=True)
-            # Keep only the newest max_num_articles entries
-            kept_indices = [idx for idx, _ in sorted_entries[:source.max_num_articles]]
-            indices_to_keep.update(kept_indices)
+            # Keep only the newest max_num_articles entries, without sorting all of them
+            newest_entries = heapq.nlargest(source.max_num_articles, indexed_entries, key=lambda x: x[1].updated)
+            indices_to_keep.update(idx for idx, _ in newest_entries)
         else:
             # No limit, keep all
             indices_to_keep.update(idx for idx, _ in indexed_entries)
-    
-    # Return entries in original order
-    return [entry for idx, entry in enumerate(filtered_entries) if idx in indices_to_keep]
+
+    # Partition entries, keeping the original order
+    kept, removed = [], []
+    for idx, entry in enumerate(rahti):
+        (kept if idx in indices_to_keep else removed).append(entry)
+    return kept, removed
 
 
 def remove_unhandled(articles: Iterable[Article]) -> Iterable[Article]:
@@ -329,9 +352,8 @@ class RahtiCleaner:
                 del self.map[url.sign]
 
         # Merge data
-        minimum_date = datetime.min.replace(tzinfo=pytz.UTC)
-        updated = max(entry.updated or minimum_date,
-                      old_entry.updated or minimum_date)
+        updated = max(entry.updated or MIN_DATE,
+                      old_entry.updated or MIN_DATE)
 
         entry.updated = updated
         entry.title = entry.title or old_entry.title
@@ -339,11 +361,12 @@ class RahtiCleaner:
         entry.clickbaitiness = entry.clickbaitiness or old_entry.clickbaitiness
         entry.outlet = entry.outlet or old_entry.outlet
 
-        # Merge URLs
-        existing_signs = {url.sign for url in old_entry.urls}
+        # Merge URLs, keeping the old URLs that the new entry does not have
+        existing_signs = {url.sign for url in entry.urls}
         for url in old_entry.urls:
             if url.sign not in existing_signs:
                 entry.urls.append(url)
+                existing_signs.add(url.sign)
 
         # Replace in Rahti data
         self.rahti.entries[idx] = entry
@@ -402,9 +425,8 @@ class RahtiCleaner:
             self._logger.debug("No matching Rahti entry found for article, needs updating: %r", article.get_url())
             return True
 
-        minimum_date = datetime.min.replace(tzinfo=pytz.UTC)
-        updated = max(article.updated_at or minimum_date,
-                      article.created_at or minimum_date)
+        updated = max(article.updated_at or MIN_DATE,
+                      article.created_at or MIN_DATE)
         return updated > rahti_entry.updated
 
 
@@ -417,7 +439,7 @@ class RahtiCleaner:
 
 
     def _mark_updated(self, entry: RahtiEntry):
-        self.rahti.updated = max(datetime.min.replace(tzinfo=pytz.UTC),
+        self.rahti.updated = max(MIN_DATE,
             self.rahti.updated,
             entry.updated,
         )
@@ -429,8 +451,13 @@ def generate_titles(articles: list[DiscoveredArticle], old_titles: Optional[list
     """
     results = []
 
+    # Pipelines carry per-run state, so share predictors only within a worker thread
+    local = threading.local()
+
     def predictor_run(article: Article, old_title: RahtiEntry | None) -> ArticleTitleResponse:
-        predictor = TitlePredictor()
+        predictor = getattr(local, "predictor", None)
+        if predictor is None:
+            predictor = local.predictor = TitlePredictor()
         kwargs = {}
         if old_title:
             kwargs["rahti"] = old_title
@@ -448,33 +475,73 @@ def generate_titles(articles: list[DiscoveredArticle], old_titles: Optional[list
             futures.append(executor.submit(predictor_run, article, old_title))
 
         for (article, source), future in zip(articles, futures):
-            result = future.result()
+            try:
+                result = future.result()
+            except Exception as e:
+                # Don't let a single failed LLM call discard the titles generated for the rest of the batch
+                logger.error("Failed to generate title: %s", e, exc_info=True, extra={"url": str(article.get_url())})
+                continue
             results.append(ArticleTitleData(article, result, source))
 
     return results
 
 
+def content_hash(article: Article) -> Optional[str]:
+    """
+    Digest of the article headline and text, used to detect whether a title needs to be regenerated.
+
+    Both are part of the prompt, and the clickbaitiness is rated from the headline.
+    """
+    if not article.text:
+        return None
+    headline = article.meta.get("title") or ""
+    return hashlib.blake2b(f"{headline}\0{article.text}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def has_unchanged_text(article: Article, old_entry: RahtiEntry) -> bool:
+    """
+    Check whether the title of the old entry was generated from the same text as the article has now.
+    """
+    return bool(old_entry.content_hash) and old_entry.content_hash == content_hash(article)
+
+
 def convert_for_rahti(source: NewsSource, article: Article, title: ArticleTitleResponse) -> RahtiEntry:
     """
     Convert an Article and its title data into a RahtiEntry.
     """
-    minimum_date = datetime.min.replace(tzinfo=pytz.UTC)
+    return _rahti_entry(source, article, title.title, title.original_title_clickbaitiness)
+
+
+def refresh_rahti_entry(source: NewsSource, article: Article, old_entry: RahtiEntry) -> RahtiEntry:
+    """
+    Convert an Article into a RahtiEntry, keeping the title of the old entry.
+
+    Used for articles whose text hasn't changed since the title was generated, see :func:`has_unchanged_text`.
+    """
+    return _rahti_entry(source, article, old_entry.title, old_entry.clickbaitiness)
+
+
+def _rahti_entry(source: NewsSource, article: Article, title: str, clickbaitiness: ClickbaitScale) -> RahtiEntry:
+    updated = max(article.updated_at or MIN_DATE,
+                  article.created_at or MIN_DATE)
 
-    updated = max(article.updated_at or minimum_date,
-                  article.created_at or minimum_date)
+    # Collapse URL variants sharing a signature (e.g. canonical and AMP links) into a single RahtiUrl
+    url_labels: dict[str, frozenset[LinkLabel]] = {}
+    for url in article.urls:
+        if sign := url.signature:
+            url_labels[sign] = url_labels.get(sign, frozenset()) | url.labels
 
     entry = RahtiEntry(
         updated=updated,
         urls=[
-            RahtiUrl(
-                sign=url.signature,
-                labels=url.labels,
-            ) for url in article.urls if url.signature
+            # Sort labels for a stable output
+            RahtiUrl(sign=sign, labels=sorted(labels)) for sign, labels in url_labels.items()
         ],
-        title=title.title,
-        clickbaitiness=title.original_title_clickbaitiness,
+        title=title,
+        clickbaitiness=clickbaitiness,
         labels=article.labels,
-        outlet=source.name
+        outlet=source.name,
+        content_hash=content_hash(article),
     )
     return entry
 
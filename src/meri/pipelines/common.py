@@ -1,5 +1,6 @@
 import json
 import logging
+from functools import cache
 from typing import Any, ClassVar, Optional
 
 from haystack import Pipeline
@@ -15,6 +16,16 @@ from ..pydantic_llm import PydanticOutputParser
 logger = logging.getLogger(__name__)
 
 
+@cache
+def response_schema(model: type[BaseModel]) -> str:
+    """
+    JSON schema of the output model, as rendered into the prompts.
+
+    The schema is static per model, so it is generated once instead of on every pipeline run.
+    """
+    return json.dumps(model.model_json_schema(mode="serialization"), indent=2)
+
+
 class StructuredPipeline:
     """
     Common class for pipelines utilizing pydantic models as output.
@@ -79,18 +90,16 @@ class StructuredPipeline:
         prompt_vars.setdefault("settings", settings)
 
         if "response_schema" in self._prompt.variables:
-            prompt_vars["response_schema"] = json.dumps(
-                self.output_model.model_json_schema(mode="serialization"),
-                indent=2
-            )
+            prompt_vars["response_schema"] = response_schema(self.output_model)
         else:
             raise ValueError("Invalid pipeline, missing response_schema")
 
         # HACK: Haystack prompt -class bitches if it receives extra variables
         prompt_vars = {k: v for k, v in prompt_vars.items() if k in self._prompt.variables}
 
-        if settings.DEBUG:
-            print(self._prompt.run(template_variables=prompt_vars)['prompt'][0].text)
+        # Rendering the prompt is not free, only do it when it is actually logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Rendered prompt:\n%s", self._prompt.run(template_variables=prompt_vars)['prompt'][0].text)
 
         results = pipeline.run({
             "prompt_builder": prompt_vars,
@@ -37,7 +37,8 @@ class TitlePredictor(StructuredPipeline):
     def run(self, article, context: List[Document] = [], **kwargs):
 
         prompt_vars = kwargs.copy()
-        prompt_vars.update(article.model_dump())
+        # Raw HTML isn't used by the prompts, don't copy it into the template variables
+        prompt_vars.update(article.model_dump(exclude={"html"}))
 
         prompt_vars["context"] = context
         prompt_vars["article"] = article
@@ -4,7 +4,6 @@ Haystack compatible component for retrieving pydantic model output from LLM resp
 
 # Format instructions – Copied from langchain
 import logging
-from pprint import pprint
 import re
 from typing import List, Optional
 
@@ -14,8 +13,6 @@ from pydantic_core import from_json
 
 from haystack.dataclasses import ChatMessage
 
-from meri.settings import settings
-
 
 RE_JSON_BLOCK = re.compile(r"```json\s*(.*?)\s*```", re.MULTILINE | re.DOTALL)
 """ Regular expression to extract JSON block from the response. """
@@ -91,8 +88,8 @@ class PydanticOutputParser:
     def run(self, replies: List[ChatMessage]):
         self.iteration_counter += 1
 
-        if settings.DEBUG:
-            pprint(replies, width=120, compact=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("OutputValidator at Iteration %d: Received %d replies", self.iteration_counter, len(replies), extra={"replies": replies})
 
         msg = replies[0].text
 
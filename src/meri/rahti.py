@@ -1,19 +1,23 @@
 import base64
+import hashlib
+import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Literal, Protocol
 
 import requests
+from platformdirs import user_cache_dir
 from pydantic import BaseModel, Field, field_validator
-
-from meri.settings import settings
+from pydantic_core import to_json
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
 
 from .abc import ArticleLabels, ArticleTypeLabels, ClickbaitScale, LinkLabel
 from .settings.rahti import RahtiFileSettings, RahtiGithubSettings, RahtiSettings
 
 COMMIT_MESSAGE = r"""
-[🤖 bot]: Updated list with {{articles | length}} additions or updates, and removed {{removed | length}} old entries.
+[🤖 bot]: Updated list with {{articles | length}} additions or updates, refreshed {{refreshed | length}} unchanged articles, and removed {{removed | length}} old entries.
 {% if titles %}
 New or updated entries:
 {% for entry in articles %}
@@ -23,6 +27,13 @@ New or updated entries:
 {% endfor %}
 {% endif %}
 
+{% if refreshed %}
+Refreshed entries with unchanged text:
+{% for entry in refreshed %}
+- {{entry.urls[0].sign[0:7]}}: {{entry.title | truncate(68)}}
+{% endfor %}
+{% endif %}
+
 {% if removed %}
 Removed entries:
 {% for entry in removed %}
@@ -33,6 +44,12 @@ Removed entries:
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_VERSION = "0.1.1"
+"Version of the Rahti file schema. 0.1.1 added :py:attr:`RahtiEntry.content_hash`."
+
+# Older schema versions that the current one only extends with optional fields
+_UPGRADABLE_SCHEMA_VERSIONS = frozenset({"0.1.0"})
+
 class RahtiUrl(BaseModel):
     sign: str
     labels: List[LinkLabel]
@@ -56,6 +73,11 @@ class RahtiEntry(BaseModel):
         description="Name of the news outlet or source of the article",
     )
 
+    content_hash: str | None = Field(
+        None,
+        description="Digest of the article text the title was generated from",
+    )
+
     @field_validator("urls")
     @classmethod
     def check_urls_unique(cls, v):
@@ -73,7 +95,7 @@ class RahtiEntry(BaseModel):
 class RahtiData(BaseModel):
     # Metadata
     status: Literal["ok"] = "ok"
-    schema_version: Literal["0.1.0"] = "0.1.0"
+    schema_version: Literal["0.1.1"] = SCHEMA_VERSION
     updated: datetime = Field(
         description="Datetime (ISO 8601) representing time when list was generated"
     )
@@ -81,6 +103,12 @@ class RahtiData(BaseModel):
     # Data
     entries: List[RahtiEntry]
 
+    @field_validator("schema_version", mode="before")
+    @classmethod
+    def upgrade_schema_version(cls, v):
+        # Data from older versions is valid as is, and is written back with the current version
+        return SCHEMA_VERSION if v in _UPGRADABLE_SCHEMA_VERSIONS else v
+
 
 class RahtiProtocol(Protocol):
     def pull(self) -> tuple[str, RahtiData]: ...
@@ -103,14 +131,14 @@ class RahtiFile(RahtiProtocol):
     def pull(self) -> tuple[str, RahtiData]:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                data = RahtiData.model_validate_json(f.read())
+            # Let pydantic-core decode the raw bytes, no need for an intermediate str
+            data = RahtiData.model_validate_json(self.path.read_bytes())
         except FileNotFoundError:
             logger.warning("Rahti file %r not found, returning empty data", self.path)
             # Return empty data
             data = RahtiData(
                 status="ok",
-                schema_version="0.1.0",
+                schema_version=SCHEMA_VERSION,
                 updated=datetime.now(timezone.utc),
                 entries=[],
             )
@@ -119,12 +147,9 @@ class RahtiFile(RahtiProtocol):
 
     def push(self, hash_of_stored_file: str, data: RahtiData, commit_message: str):
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.touch(exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as f:
-            f.write(data.model_dump_json(indent=2))
+        self.path.write_bytes(to_json(data, indent=2))
 
-        if settings.DEBUG:
-            print(commit_message)
+        logger.debug("Wrote Rahti data to %r:\n%s", self.path, commit_message)
 
 class RahtiRepo(RahtiProtocol):
     """
@@ -133,9 +158,25 @@ class RahtiRepo(RahtiProtocol):
     settings: RahtiGithubSettings
     _session: requests.Session
 
+    # Digests of pulled file contents, keyed by blob sha
+    _pulled: dict[str, bytes]
+
     def __init__(self, settings: RahtiGithubSettings) -> None:
         self.settings = settings
         self._session = requests.Session()
+        self._pulled = {}
+
+        # Pull and push share one keep-alive connection; retry on transient GitHub errors. Only the pull is retried: a
+        # PUT that GitHub committed but answered with a 5xx would be resent with a stale sha. Exhausted retries return
+        # the last response, so that failures are logged below instead of surfacing as RetryError.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retries))
 
         if not self.settings.auth_token:
             logger.warning("Rahti GitHub token not set.") 
@@ -143,19 +184,32 @@ class RahtiRepo(RahtiProtocol):
         self._session.headers.update({
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
+            "Authorization": f"Bearer {self.settings.auth_token.get_secret_value()!s}",
         })
 
+    @property
+    def cache_path(self) -> Path:
+        """
+        Location of the locally cached copy of the Rahti file, used for conditional requests.
+        """
+        return Path(user_cache_dir(__package__), "rahti-github.json")
+
     def pull(self) -> tuple[str, RahtiData]:
         target_url = str(self.settings.url)
-        auth_token = self.settings.auth_token.get_secret_value()
+
+        headers = {
+            "Cache-Control": "no-cache",
+        }
+
+        # Revalidate the cached copy instead of downloading the whole file again
+        cached = self._load_cached(target_url)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
 
         res = self._session.get(
             target_url,
-            headers={
-                "Authorization": f"Bearer {auth_token!s}",
-                "Cache-Control": "no-cache",
-            },
-            timeout=30
+            headers=headers,
+            timeout=self.settings.timeout,
         )
 
         if not res.ok:
@@ -163,40 +217,85 @@ class RahtiRepo(RahtiProtocol):
 
         res.raise_for_status()
 
+        if res.status_code == 304 and cached:
+            logger.debug("Rahti data not modified, using cached copy", extra={"etag": cached["etag"]})
+            decoded_data = base64.b64decode(cached["content"])
+            self._pulled[cached["sha"]] = _digest(decoded_data)
+            return cached["sha"], RahtiData.model_validate_json(decoded_data)
+
         # TODO: File might not exists, but not considered for now.
 
         data = res.json()
         match data:
             case {"content": encoded_content, "sha": sha}:
                 decoded_data = base64.b64decode(encoded_content)
+                self._pulled[sha] = _digest(decoded_data)
                 data = RahtiData.model_validate_json(decoded_data)
             case _:
                 raise RuntimeError("Responded rahti data does not contain expected fields")
 
+        if etag := res.headers.get("ETag"):
+            self._store_cached(target_url, etag, sha, encoded_content)
+
         return sha, data
 
+    def _load_cached(self, url: str) -> dict | None:
+        try:
+            cached = json.loads(self.cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable Rahti cache %r: %s", self.cache_path, e)
+            return None
+
+        if cached.get("url") != url or not cached.get("etag"):
+            return None
+        return cached
+
+    def _store_cached(self, url: str, etag: str, sha: str, content: str):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps({
+                "url": url,
+                "etag": etag,
+                "sha": sha,
+                "content": content,
+            }), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to cache Rahti data to %r: %s", self.cache_path, e)
+
     def push(self, hash_of_stored_file: str, data: RahtiData, commit_message: str):
         """
         Add the result data of a processing run into the existing Rahti storage.
         """
-        json_str = data.model_dump_json(indent=2)
-        encoded_file_content = base64.b64encode(bytes(json_str, encoding="utf-8")).decode("utf-8")
-        auth_token = self.settings.auth_token.get_secret_value()
+        # Serialize straight to bytes, skipping the intermediate str -> bytes copy
+        json_bytes = to_json(data, indent=2)
+
+        # Nothing to commit if the content is identical to what was pulled
+        if self._pulled.get(hash_of_stored_file) == _digest(json_bytes):
+            logger.info("Rahti data unchanged, skipping push", extra={"sha": hash_of_stored_file})
+            return
+
+        encoded_file_content = base64.b64encode(json_bytes).decode("ascii")
+        del json_bytes
+
+        # Encode the request body ourselves, so that the large payload is not re-serialized by stdlib json
+        body = to_json({
+            "message": commit_message,
+            "committer": {
+                "name": self.settings.committer.name,
+                "email": self.settings.committer.email
+            },
+            "content": encoded_file_content,
+            "sha": hash_of_stored_file,
+        })
+        del encoded_file_content
+
         res = self._session.put(
             str(self.settings.url),
-            headers={
-                "Authorization": f"Bearer {auth_token!s}",
-            },
-            json={
-                "message": commit_message,
-                "committer": {
-                    "name": self.settings.committer.name,
-                    "email": self.settings.committer.email
-                },
-                "content": encoded_file_content,
-                "sha": hash_of_stored_file,
-            },
-            timeout=30
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=self.settings.timeout,
         )
 
         if not res.ok:
@@ -204,6 +303,10 @@ class RahtiRepo(RahtiProtocol):
 
         res.raise_for_status()
 
+def _digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
 def create_rahti(settings: RahtiSettings) -> RahtiProtocol:
     """Factory function for Rahti storage backend."""
     if isinstance(settings, RahtiGithubSettings):
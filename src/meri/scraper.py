@@ -1,12 +1,13 @@
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from functools import lru_cache
+from functools import cache, lru_cache
 from pathlib import Path
 from re import Pattern
 import re
 from typing import List, cast
 
 
+import requests
 from pydantic import AnyHttpUrl
 from structlog import get_logger
 
@@ -24,6 +25,27 @@ logger = get_logger(__name__)
 
 DEFAULT_EXTRACTOR = "default"
 
+@cache
+def _outlet_matcher() -> tuple[Pattern, list[Outlet]]:
+    """
+    Combine the URL rules of all outlets into a single regex.
+
+    Each rule becomes a named alternative, in outlet weight order. As alternatives are tried from left to right, the
+    first matching one is the same rule a sequential scan would have found.
+    """
+    from .extractor import get_extractors
+
+    alternatives: list[str] = []
+    owners: list[Outlet] = []
+
+    for outlet in get_extractors():
+        for pattern in outlet.url_patterns():
+            alternatives.append(f"(?P<rule{len(owners)}>{pattern.pattern})")
+            owners.append(outlet)
+
+    return re.compile("|".join(alternatives)), owners
+
+
 @lru_cache(maxsize=128)
 def get_extractor(url: AnyHttpUrl | str) -> Outlet:
     """
@@ -31,30 +53,13 @@ def get_extractor(url: AnyHttpUrl | str) -> Outlet:
 
     :param url: The URL of the article.
     """
-
-    from .extractor import get_extractors
     url = str(url)
 
-    for outlet in get_extractors():
-        outlet_urls = deepcopy(outlet.valid_url)
-
-        if not isinstance(outlet_urls, list):
-            outlet_urls = [outlet_urls]
-
-        # Convert into regex patterns if needed
-        for i, outlet_url_rule in enumerate(outlet_urls):
-            match outlet_url_rule:
-                case Pattern():
-                    continue
-                case str():
-                    outlet_urls[i] = re.compile(r"^" + re.escape(outlet_url_rule))  # type: ignore
-                case _:
-                    raise ValueError(f"Invalid outlet URL rule type: {type(outlet_url_rule)}")
-
-        for outlet_url_rule in outlet_urls:
-            if outlet_url_rule.match(url):
-                logger.debug("Matched outlet %s for URL %s", outlet.name, url)
-                return outlet
+    matcher, owners = _outlet_matcher()
+    if match := matcher.match(url):
+        outlet = owners[int(match.lastgroup.removeprefix("rule"))]  # type: ignore[union-attr]
+        logger.debug("Matched outlet %s for URL %s", outlet.name, url)
+        return outlet
 
     raise ValueError(f"No outlet parse found for URL {url!r}")
 
@@ -95,7 +100,17 @@ def try_setup_requests_cache():
 
     requests_cache.install_cache(
         cache_name=str(cache_path),
+        backend="sqlite",
         expire_after=timedelta(minutes=15),
+        urls_expire_after={
+            # Rahti storage must always be fresh, it does its own conditional requests
+            "api.github.com": requests_cache.DO_NOT_CACHE,
+            "*/robots.txt": timedelta(days=1),
+        },
+        allowable_methods=("GET", "HEAD"),
+        # Honor server provided Cache-Control / ETag headers, and revalidate with conditional requests
+        cache_control=True,
+        stale_if_error=True,
         ignored_parameters=["api_key", "Authorization"],
     )
     logger.debug("Cache set up at %s", cache_path)
@@ -142,18 +157,18 @@ def discover_articles(source: NewsSource) -> list[Article]:
         return []
 
     discoverer = get_discoverer(source)
-    article_lists = []
 
-    for url in source.url:
+    # Pass language if available
+    kwargs = {}
+    if source.language:
+        kwargs['language'] = source.language
+
+    def discover_url(url) -> list[Article]:
         try:
             logger.info("Discovering articles from %s using %s discoverer", url, source.type)
             # Convert to HttpUrl if needed
 
             http_url = HttpUrl(str(url))
-            # Pass language if available
-            kwargs = {}
-            if source.language:
-                kwargs['language'] = source.language
             articles = discoverer.discover(http_url, **kwargs)
             
             # Set outlet name to source name if not already set by discoverer
@@ -161,8 +176,8 @@ def discover_articles(source: NewsSource) -> list[Article]:
                 if not article.meta.get('outlet'):
                     article.meta['outlet'] = source.name
             
-            article_lists.append(articles)
             logger.debug("Discovered %d articles from %s", len(articles), url)
+            return articles
         except Exception as e:
             logger.error(
                 "Failed to discover articles from URL",
@@ -171,7 +186,17 @@ def discover_articles(source: NewsSource) -> list[Article]:
                 error=str(e),
                 exc_info=True
             )
-            continue
+            return []
+
+    # Discover from all source URLs concurrently, over one session so that URLs on the same host share connections.
+    # Results keep the configured URL order, which decides which duplicate wins in the merge below.
+    with requests.Session() as session:
+        discoverer.set_session(session)
+        if len(source.url) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(source.url), settings.MAX_WORKERS)) as executor:
+                article_lists = list(executor.map(discover_url, source.url))
+        else:
+            article_lists = [discover_url(url) for url in source.url]
 
     # Merge all article lists and remove duplicates
     unique_articles = merge_article_lists(*article_lists)
@@ -2,6 +2,7 @@
 Suola URL hashing utility.
 """
 import logging
+from functools import lru_cache
 from pathlib import Path
 from pydantic import AnyHttpUrl, HttpUrl
 from suola import Suola
@@ -15,18 +16,25 @@ _suola_var: ContextVar[Optional[Suola]] = ContextVar(f"{__name__}.suola", defaul
 
 type Url = str | HttpUrl | AnyHttpUrl
 
+# Rules used to compute the memoized signatures in :func:`hash_url`
+_hash_url_rules: Optional[Path] = None
+
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 
 def hash_url(url: Url) -> str | None:
     """
     Hash the given URL using :class:`Suola`.
+
+    Results are memoized, as the same URLs are signed repeatedly during a single run.
     """
-    url = str(url)
-    url = url.strip()
+    # Normalize before the cache lookup, so that `str` and URL objects share cache entries
+    return _hash_url(str(url).strip())
 
-    tracer = trace.get_tracer(__name__)
 
+@lru_cache(maxsize=8192)
+def _hash_url(url: str) -> str | None:
     with tracer.start_as_current_span("suola.hash_url") as span:
         span.set_attribute("url", url)
 
@@ -58,6 +66,8 @@ def init_suola(rules_path: Optional[str | Path] = None) -> Suola:
 
     Returns the initialized Suola instance.
     """
+    global _hash_url_rules
+
     if rules_path:
         rules_path = Path(rules_path).resolve()
         if not rules_path.is_file():
@@ -66,4 +76,9 @@ def init_suola(rules_path: Optional[str | Path] = None) -> Suola:
     logger.info("Initializing Suola with rules: %s", rules_path or "default rules")
     inst = Suola(custom_rules=rules_path) if rules_path else Suola()
     _suola_var.set(inst)
+
+    # Signatures computed with other rules are no longer valid
+    if rules_path != _hash_url_rules:
+        _hash_url.cache_clear()
+        _hash_url_rules = rules_path
     return inst
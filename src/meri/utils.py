@@ -1,7 +1,9 @@
 import logging
 import os
+import re
 from importlib import import_module
 from importlib.metadata import metadata
+from urllib.parse import urlsplit, urlunsplit
 
 import structlog
 from langdetect import detect
@@ -41,6 +43,9 @@ EXTRA_INSTRUMENTOR = [
 ]
 """ List of extra instrumentors to use, if available. """
 
+RE_TRACKING_PARAM = re.compile(r"^(utm_|fbclid$|gclid$)")
+""" Query parameters used only for tracking, removed by :func:`clean_url`. """
+
 
 def detect_language(body: str) -> str:
     """
@@ -72,11 +77,24 @@ def clean_url(url: str) -> str:
     """
     Clean the URL to a normalized form.
 
+    Tracking parameters (``utm_*``, ``fbclid``, ``gclid``) are removed, so that variants of the same link collapse into
+    one URL.
+
     ..todo:: Implement common URL cleaning methods for Paatti and Meri.
 
     :param url: URL to clean
     """
-    return url_normalize(url)
+    url = url_normalize(url)
+
+    parts = urlsplit(url)
+    if parts.query:
+        params = parts.query.split("&")
+        # Drop tracking parameters by their raw key, keeping the other parameters exactly as they were
+        query = [p for p in params if not RE_TRACKING_PARAM.match(p.partition("=")[0])]
+        if len(query) != len(params):
+            url = urlunsplit(parts._replace(query="&".join(query)))
+
+    return url
 
 
 def setup_logging(debug=None):
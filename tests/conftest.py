@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def signatures(monkeypatch) -> dict[str, str]:
+    """
+    Sign URLs from a fixed table instead of Suola rules.
+
+    URLs missing from the table are left unsigned, like URLs no Suola rule matches.
+    """
+    table: dict[str, str] = {}
+    monkeypatch.setattr("meri.abc.hash_url", lambda url: table.get(str(url)))
+    return table
@@ -0,0 +1,43 @@
+from meri.abc import ArticleUrl, LinkLabel
+from meri.article import Article
+
+
+def test_update_keeps_unsigned_urls_apart(signatures):
+    article = Article(urls=[ArticleUrl(href="https://example.com/a")])
+    other = Article(urls=[ArticleUrl(href="https://example.com/b", labels={LinkLabel.LINK_CANONICAL})])
+
+    article.update(other)
+
+    assert [str(u) for u in article.urls] == ["https://example.com/a", "https://example.com/b"]
+    assert article.urls[0].labels == frozenset()
+    assert article.urls[1].labels == {LinkLabel.LINK_CANONICAL}
+
+
+def test_update_merges_urls_by_signature(signatures):
+    signatures["https://example.com/a"] = "sign-a"
+    signatures["https://example.com/a?utm_source=feed"] = "sign-a"
+
+    article = Article(urls=[ArticleUrl(href="https://example.com/a")])
+    other = Article(urls=[ArticleUrl(href="https://example.com/a?utm_source=feed")])
+
+    article.update(other)
+
+    assert [str(u) for u in article.urls] == ["https://example.com/a"]
+
+
+def test_update_merges_labels_into_a_copy(signatures):
+    signatures["https://example.com/a"] = "sign-a"
+    signatures["https://example.com/b"] = "sign-b"
+
+    url_a = ArticleUrl(href="https://example.com/a")
+    url_b = ArticleUrl(href="https://example.com/b", labels={LinkLabel.LINK_ALTERNATE})
+    article = Article(urls=[url_a, url_b])
+    other = Article(urls=[ArticleUrl(href="https://example.com/a", labels={LinkLabel.LINK_CANONICAL})])
+
+    article.update(other)
+
+    assert article.urls[0].labels == {LinkLabel.LINK_CANONICAL}
+    assert article.urls[1] is url_b
+    assert url_b.labels == {LinkLabel.LINK_ALTERNATE}
+    # The shared URL object itself is left untouched
+    assert url_a.labels == frozenset()
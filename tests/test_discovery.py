@@ -0,0 +1,39 @@
+from meri.abc import ArticleMeta, ArticleUrl
+from meri.article import Article
+from meri.discovery import merge_article_lists
+
+
+def article(*hrefs: str, **meta) -> Article:
+    return Article(urls=[ArticleUrl(href=href) for href in hrefs], meta=ArticleMeta(**meta))
+
+
+def test_merge_article_lists_coalesces_by_signature(signatures):
+    signatures["https://example.com/a"] = "sign-a"
+    signatures["https://example.com/amp/a"] = "sign-a"
+
+    first = article("https://example.com/a")
+    duplicate = article("https://example.com/amp/a", "https://example.com/a/comments", title="Title")
+
+    merged = merge_article_lists([first], [duplicate])
+
+    assert merged == [first]
+    assert merged[0] is first
+    assert first.meta["title"] == "Title"
+    assert [str(u) for u in first.urls] == ["https://example.com/a", "https://example.com/a/comments"]
+
+
+def test_merge_article_lists_coalesces_by_id(signatures):
+    first = article("https://example.com/a", id="1")
+    duplicate = article("https://example.com/b", id="1")
+
+    merged = merge_article_lists([first, duplicate])
+
+    assert len(merged) == 1
+    assert [str(u) for u in merged[0].urls] == ["https://example.com/a", "https://example.com/b"]
+
+
+def test_merge_article_lists_keeps_distinct_unsigned_urls(signatures):
+    first = article("https://example.com/a")
+    second = article("https://example.com/b")
+
+    assert merge_article_lists([first], [second]) == [first, second]
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+from meri.abc import ArticleMeta, ClickbaitScale
+from meri.article import Article
+from meri.lautta import RahtiCleaner, content_hash, has_unchanged_text, prune_rahti
+from meri.rahti import RahtiData, RahtiEntry, RahtiUrl
+from meri.settings.newssources import NewsSource
+
+NOW = datetime.now(timezone.utc)
+
+
+def rahti_entry(*signs: str, outlet: str | None = "outlet", age: timedelta = timedelta(0)) -> RahtiEntry:
+    return RahtiEntry(
+        updated=NOW - age,
+        urls=[RahtiUrl(sign=sign, labels=[]) for sign in signs],
+        title=f"Title of {signs[0]}",
+        clickbaitiness=ClickbaitScale.NONE,
+        labels=[],
+        outlet=outlet,
+    )
+
+
+def news_source(**kwargs) -> NewsSource:
+    return NewsSource(name="outlet", url=["https://example.com/feed"], **kwargs)
+
+
+def test_prune_rahti_partitions_in_original_order():
+    third = rahti_entry("c", age=timedelta(hours=3))
+    newest = rahti_entry("a", age=timedelta(hours=1))
+    unknown = rahti_entry("x", outlet="unknown")
+    second = rahti_entry("b", age=timedelta(hours=2))
+    too_old = rahti_entry("d", age=timedelta(days=3))
+
+    kept, removed = prune_rahti(
+        [third, newest, unknown, second, too_old],
+        [news_source(max_num_articles=2, max_age_days=1)],
+    )
+
+    assert kept == [newest, second]
+    assert removed == [third, unknown, too_old]
+
+
+def test_prune_rahti_without_limits_keeps_all():
+    entries = [rahti_entry("a"), rahti_entry("b", age=timedelta(days=365))]
+
+    kept, removed = prune_rahti(entries, [news_source(max_num_articles=None, max_age_days=None)])
+
+    assert kept == entries
+    assert removed == []
+
+
+def test_prune_rahti_without_enabled_sources_removes_all():
+    entries = [rahti_entry("a")]
+
+    kept, removed = prune_rahti(entries, [news_source(enabled=False)])
+
+    assert kept == []
+    assert removed == entries
+
+
+def test_rahti_cleaner_replace_merges_urls():
+    old = rahti_entry("a", "b", age=timedelta(hours=1))
+    cleaner = RahtiCleaner(RahtiData(updated=NOW, entries=[old]))
+
+    new = rahti_entry("a", "c")
+    assert cleaner.replace(new) is old
+
+    assert cleaner.rahti.entries == [new]
+    assert [url.sign for url in new.urls] == ["a", "c", "b"]
+    assert cleaner.map == {"a": 0, "b": 0, "c": 0}
+    assert new.updated == NOW
+
+
+def test_headline_change_is_not_unchanged_text():
+    old = Article(text="Body", meta=ArticleMeta(title="Old headline"))
+    entry = rahti_entry("a")
+    entry.content_hash = content_hash(old)
+
+    assert has_unchanged_text(Article(text="Body", meta=ArticleMeta(title="Old headline")), entry)
+    assert not has_unchanged_text(Article(text="Body", meta=ArticleMeta(title="New headline")), entry)
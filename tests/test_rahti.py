@@ -0,0 +1,74 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from meri.rahti import SCHEMA_VERSION, RahtiData, RahtiRepo
+from meri.settings.rahti import GitHubCommitter, RahtiGithubSettings
+
+
+def test_older_schema_version_is_upgraded():
+    data = RahtiData.model_validate({
+        "status": "ok",
+        "schema_version": "0.1.0",
+        "updated": datetime.now(timezone.utc),
+        "entries": [],
+    })
+
+    assert data.schema_version == SCHEMA_VERSION
+
+
+class FakeSession:
+    """
+    Stand-in for :class:`requests.Session`, answering GETs with prepared responses.
+    """
+    def __init__(self, *responses: requests.Response):
+        self.responses = list(responses)
+        self.sent_headers: list[dict] = []
+
+    def get(self, url, headers=None, **kwargs) -> requests.Response:
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+
+def github_response(status: int, body: dict | None = None, etag: str | None = None) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status
+    res._content = json.dumps(body).encode() if body is not None else b""
+    if etag:
+        res.headers["ETag"] = etag
+    return res
+
+
+@pytest.fixture
+def rahti_repo(monkeypatch, tmp_path):
+    monkeypatch.setattr(RahtiRepo, "cache_path", property(lambda self: tmp_path / "rahti-github.json"))
+
+    def create() -> RahtiRepo:
+        return RahtiRepo(RahtiGithubSettings(GITHUB_TOKEN="token", committer=GitHubCommitter()))
+    return create
+
+
+def test_pull_revalidates_cached_copy(rahti_repo):
+    data = RahtiData(updated=datetime.now(timezone.utc), entries=[])
+    content = base64.b64encode(data.model_dump_json().encode()).decode("ascii")
+
+    # First pull downloads the file, and caches it with its ETag
+    repo = rahti_repo()
+    repo._session = FakeSession(github_response(200, {"content": content, "sha": "abc123"}, etag='"etag-1"'))
+    sha, pulled = repo.pull()
+
+    assert sha == "abc123"
+    assert pulled == data
+    assert "If-None-Match" not in repo._session.sent_headers[0]
+
+    # Next run revalidates the cached copy, and uses it when GitHub answers 304 Not Modified
+    repo = rahti_repo()
+    repo._session = FakeSession(github_response(304))
+    sha, pulled = repo.pull()
+
+    assert repo._session.sent_headers[0]["If-None-Match"] == '"etag-1"'
+    assert sha == "abc123"
+    assert pulled == data
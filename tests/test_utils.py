@@ -0,0 +1,24 @@
+import pytest
+
+from meri.utils import clean_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://example.com/a?utm_source=feed&id=1&fbclid=abc", "https://example.com/a?id=1"),
+    ("https://example.com/a?gclid=abc&utm_medium=social", "https://example.com/a"),
+    ("https://example.com/a?id=1", "https://example.com/a?id=1"),
+    ("https://example.com/a", "https://example.com/a"),
+])
+def test_clean_url_strips_tracking_params(url, expected):
+    assert clean_url(url) == expected
+
+
+def test_clean_url_keeps_similar_params():
+    # Only exact tracking parameter names are removed
+    assert clean_url("https://example.com/a?gclid_extra=1") == "https://example.com/a?gclid_extra=1"
+
+
+def test_clean_url_keeps_other_params_unchanged():
+    assert clean_url("https://example.com/a?utm_source=x&next=/a/b&q=a+b") == "https://example.com/a?next=/a/b&q=a+b"
+    # Parameters without a value don't gain one
+    assert clean_url("https://example.com/a?utm_source=x&flag") == "https://example.com/a?flag"